@@ -2,6 +2,100 @@ import math
 import json
 import re
 import builtins
+import warnings
+from collections import namedtuple
+from collections.abc import Sequence
+from functools import cached_property
+
+_SUB_MAP = str.maketrans("0123456789", "₀₁₂₃₄₅₆₇₈₉")
+_LABEL_RE = re.compile(r'([WPwp])(\d+)')
+_EXPR_TOKEN_RE = re.compile(r"¬?B\d+|[∩∪\(\)]")
+_MASK_EXPR_RE = re.compile(r"(?:\s|P\d+|True|False|and|or|not|[()])*")
+
+
+class _PropositionTable(Sequence):
+    """
+    Read-only sequence of all propositions of a framework.
+    Each {"id", "label", "bitstring", "worlds"} entry is built when accessed,
+    so construction costs nothing even though there are 2**(2**n_props) entries.
+    Compares equal to the equivalent list; use list(...) to serialize it (e.g. json.dumps).
+    """
+    def __init__(self, space):
+        self.space = space
+
+    def __len__(self):
+        return self.space.n_propositions
+
+    def __getitem__(self, k):
+        if isinstance(k, slice):
+            return [self[i] for i in range(*k.indices(len(self)))]
+        if k < 0:
+            k += len(self)
+        if not (0 <= k < len(self)):
+            raise IndexError("proposition index out of range")
+        return {
+            "id": k,
+            "label": f"P{k}",
+            "bitstring": self.space.get_proposition_bitstring(k),
+            "worlds": self.space.get_proposition_worlds(k)
+        }
+
+    def __eq__(self, other):
+        if isinstance(other, (list, _PropositionTable)):
+            return len(self) == len(other) and list(self) == list(other)
+        return NotImplemented
+
+    __hash__ = None  # compares equal to lists, so unhashable like them
+
+    def __repr__(self):
+        return repr(list(self))
+
+
+class WorldView(namedtuple("WorldView", "id label bitstring notation sentence")):
+    """Object-like view of a single world."""
+    __slots__ = ()
+
+    def __repr__(self):
+        return f"<{self.label}: bitstring={self.bitstring}, notation={self.notation}>"
+
+
+class PropView:
+    """Object-like view of proposition P_prop_id, computed on demand from its framework."""
+    __slots__ = ("space", "id", "label")
+
+    def __init__(self, space, prop_id):
+        self.space = space
+        self.id = prop_id
+        self.label = f"P{prop_id}"
+
+    @property
+    def worlds(self):
+        return self.space.get_proposition_worlds(self.id)
+
+    @property
+    def bitstring(self):
+        return self.space.get_proposition_bitstring(self.id)
+
+    @property
+    def notation(self):
+        return " ∪ ".join(self.worlds)
+
+    def __repr__(self):
+        return f"<{self.label}: worlds={self.worlds}, bitstring={self.bitstring}>"
+
+
+class InvalidProp:
+    """Placeholder view for a proposition index outside the framework."""
+    def __init__(self, k, max_p):
+        self.id = k
+        self.label = f"P{k} (does not exist)"
+        self.worlds = []
+        self.bitstring = ""
+        self.max_p = max_p
+
+    def __repr__(self):
+        return f"<{self.label}: does not exist, max index={self.max_p}>"
+
 
 class ConceptualFramework:
     def __init__(self, n_props, sentences=None,global_shortcuts=False):
@@ -20,9 +114,17 @@ class ConceptualFramework:
 
         self.sentences = {self.conceptual_framework[i]: sentences[i] for i in range(n_props)}
 
-        # Build worlds and propositions
-        self.possible_worlds = self._build_worlds()
-        self.possibilities = [w["label"] for w in self.possible_worlds]
+        self._prop_bits = {}  # proposition id → bitstring, filled on demand
+
+        # Negated/affirmed term of each basic sentence, keyed by its bit ("0"/"1")
+        self._notation_terms = tuple({"1": b, "0": f"¬{b}"} for b in self.conceptual_framework)
+        self._sentence_terms = tuple(
+            {"1": f"({self.sentences[b]})", "0": f"(not the case that {self.sentences[b]})"}
+            for b in self.conceptual_framework
+        )
+
+        # Worlds (possible_worlds, possibilities and their per-world tables) are
+        # built lazily on first access; propositions are always built on demand
         if n_props <= 3:
                     self.propositions = self._build_propositions()
         else:
@@ -32,12 +134,21 @@ class ConceptualFramework:
         self.w = lambda i: self._world_view(i)
         self.p = lambda k: self._prop_view(k)
         
-        # Optional global shortcuts
+        # Optional global shortcuts (prefer globals().update(cf.shortcuts()))
         if global_shortcuts:
-            builtins.W = self.w
-            builtins.P = self.p
-            builtins.g = self.g
-            builtins.prt = self.prt
+            warnings.warn(
+                "global_shortcuts=True binds W, P, g and prt in builtins for the whole process; "
+                "use globals().update(cf.shortcuts()) to bind them in one namespace instead",
+                stacklevel=2,
+            )
+            builtins.__dict__.update(self.shortcuts())
+
+    def shortcuts(self):
+        """
+        Return the notebook shortcuts W, P, g and prt as a dict, e.g.
+        globals().update(cf.shortcuts()).
+        """
+        return {"W": self.w, "P": self.p, "g": self.g, "prt": self.prt}
     
     # -----------------------------------------------------
     # --- LOGICAL EXPRESSION PARSER FOR PROPOSITIONS ---
@@ -48,25 +159,19 @@ class ConceptualFramework:
         - If expr is dict from g(), pretty both 'worlds' and 'notation'
         - If expr is string or list of strings, convert Pn/Wn to subscript
         """
-        sub_map = str.maketrans("0123456789", "₀₁₂₃₄₅₆₇₈₉")
-
         def repl(m):
-            label = m.group()
-            match = re.match(r'([WPwp])(\d+)', label)
-            if not match:
-                return label
-            base, num = match.groups()
-            return base.upper() + num.translate(sub_map)
+            base, num = m.groups()
+            return base.upper() + num.translate(_SUB_MAP)
 
         if isinstance(expr, dict) and "worlds" in expr and "notation" in expr:
             return {
-                "worlds": [re.sub(r'[WPwp]\d+', repl, w) for w in expr["worlds"]],
-                "notation": re.sub(r'[WPwp]\d+', repl, expr["notation"])
+                "worlds": [_LABEL_RE.sub(repl, w) for w in expr["worlds"]],
+                "notation": _LABEL_RE.sub(repl, expr["notation"])
             }
         elif isinstance(expr, list):
-            return [re.sub(r'[WPwp]\d+', repl, e) for e in expr]
+            return [_LABEL_RE.sub(repl, e) for e in expr]
         elif isinstance(expr, str):
-            return re.sub(r'[WPwp]\d+', repl, expr)
+            return _LABEL_RE.sub(repl, expr)
         else:
             raise TypeError("Input must be string, list of strings, or g() result dict")
 
@@ -103,14 +208,28 @@ class ConceptualFramework:
         # Find all proposition tokens
         prop_tokens = re.findall(r"P\d+", expr)
 
-        satisfying_worlds = []
+        # Pure and/or/not expressions are evaluated once over world bitmasks:
+        # each P_k is its world mask, True/False the full/empty mask, and
+        # and/or/not become &, |, ~
+        masks = {t: self.get_proposition_mask(int(t[1:])) for t in set(prop_tokens)}
+        full_mask = (1 << self.n_worlds) - 1
+        if _MASK_EXPR_RE.fullmatch(expr):
+            mask_expr = re.sub(r"\band\b", "&", expr)
+            mask_expr = re.sub(r"\bor\b", "|", mask_expr)
+            mask_expr = re.sub(r"\bnot\b", "~", mask_expr)
+            mask_expr = re.sub(r"\bTrue\b", "_full", mask_expr)
+            mask_expr = re.sub(r"\bFalse\b", "_empty", mask_expr)
+            try:
+                mask = eval(mask_expr, {"_full": full_mask, "_empty": 0}, masks)
+                if isinstance(mask, int):
+                    return {"worlds": self.get_proposition_worlds(mask & full_mask), "notation": notation}
+            except Exception as e:
+                raise ValueError(f"Cannot evaluate expression: {expr_str}. Error: {e}")
 
+        # Anything else (comparisons, arithmetic, constants) keeps per-world truth values
+        satisfying_worlds = []
         for w in self.possible_worlds:
-            # Map each proposition to True/False for this world
-            local_dict = {t: w["label"] in self.get_proposition_worlds(int(t[1:])) 
-                        for t in prop_tokens}
-
-            # Evaluate expression for this world
+            local_dict = {t: bool(m >> w["id"] & 1) for t, m in masks.items()}
             try:
                 if eval(expr, {}, local_dict):
                     satisfying_worlds.append(w["label"])
@@ -144,101 +263,93 @@ class ConceptualFramework:
     def _world_view(self, i):
         """Return an object-like view for a world."""
         w = self.possible_worlds[i]
-        class WorldView:
-            def __init__(self, world):
-                self.id = world["id"]
-                self.label = world["label"]
-                self.bitstring = world["bitstring"]
-                self.notation = world["notation"]
-                self.sentence = world["sentence_form"]
-            def __repr__(self):
-                return f"<{self.label}: bitstring={self.bitstring}, notation={self.notation}>"
-        return WorldView(w)
+        return WorldView(w["id"], w["label"], w["bitstring"], w["notation"], w["sentence_form"])
 
     # -----------------------------------------------------
-    # --- PROPOSITION VIEW METHOD ---
+    # --- LAZY WORLD TABLES ---
     # -----------------------------------------------------
-    
-    def _prop_view(self, k):
-        """Return an object-like view for a proposition."""
-        class PropView:
-            def __init__(self, space, prop_id):
-                self.space = space
-                self.id = prop_id
-                self.label = f"P{prop_id}"
-
-            @property
-            def worlds(self):
-                # Safe: return empty list for huge indices
-                return self.space.get_proposition_worlds(self.id)
-
-            @property
-            def bitstring(self):
-                if 0 <= self.id < self.space.n_propositions and self.space.n_props <= 3:
-                    return self.space.get_proposition_bitstring(self.id)
-                # Return empty or placeholder for huge indices
-                return ""
-
-            @property
-            def notation(self):
-                return " ∪ ".join(self.worlds) if self.worlds else "does not exist"
-
-            def __repr__(self):
-                if self.worlds:
-                    return f"<{self.label}: worlds={self.worlds}, bitstring={self.bitstring}>"
-                else:
-                    return f"<{self.label}: does not exist, max index={self.space.n_propositions - 1}>"
-
-        return PropView(self, k)
+    @cached_property
+    def possible_worlds(self):
+        """All possible worlds, built on first access."""
+        return self._build_worlds()
+
+    @cached_property
+    def possibilities(self):
+        """Labels of all possible worlds."""
+        return list(self._world_labels)
+
+    @cached_property
+    def _world_bits(self):
+        # Truth vectors of all worlds, formatted once and shared by all world accessors
+        return tuple(format(i, f'0{self.n_props}b') for i in range(self.n_worlds))
+
+    @cached_property
+    def _world_labels(self):
+        return tuple(f"W{i}" for i in range(self.n_worlds))
+
+    @cached_property
+    def _world_notations(self):
+        return tuple(
+            " ∩ ".join(t[bit] for t, bit in zip(self._notation_terms, bits))
+            for bits in self._world_bits
+        )
+
+    @cached_property
+    def _sentence_notations(self):
+        return tuple(
+            " ∩ ".join(t[bit] for t, bit in zip(self._sentence_terms, bits))
+            for bits in self._world_bits
+        )
 
     # -----------------------------------------------------
     # --- WORLD CONSTRUCTION METHODS ---
     # -----------------------------------------------------
     def get_world_bitstring(self, i):
         """Return the binary truth vector of world i."""
-        return format(i, f'0{self.n_props}b')
+        return self._world_bits[i]
 
     def get_world_notation(self, i):
         """Return set-theoretic notation of world i."""
-        bits = self.get_world_bitstring(i)
-        terms = []
-        for j, bit in enumerate(bits):
-            prop = self.conceptual_framework[j]
-            terms.append(prop if bit == "1" else f"¬{prop}")
-        return " ∩ ".join(terms)
+        return self._world_notations[i]
 
     def _build_worlds(self):
         """Construct all possible worlds with binary and semantic representation."""
-        worlds = []
-        for i in range(self.n_worlds):
-            bitstring = self.get_world_bitstring(i)
-            notation = self.get_world_notation(i)
-            sentence_form = self.get_sentence_notation(i)
-            worlds.append({
+        return [
+            {
                 "id": i,
-                "label": f"W{i}",
-                "bitstring": bitstring,
+                "label": label,
+                "bitstring": bits,
                 "notation": notation,
                 "sentence_form": sentence_form
-            })
-        return worlds
+            }
+            for i, (label, bits, notation, sentence_form) in enumerate(zip(
+                self._world_labels, self._world_bits, self._world_notations, self._sentence_notations
+            ))
+        ]
 
     def get_sentence_notation(self, i):
         """Return full sentential version with negations and parentheses."""
-        bits = self.get_world_bitstring(i)
-        terms = []
-        for j, bit in enumerate(bits):
-            s = self.sentences[self.conceptual_framework[j]]
-            term = s if bit == "1" else f"not the case that {s}"
-            terms.append(f"({term})")
-        return " ∩ ".join(terms)
+        return self._sentence_notations[i]
 
     # -----------------------------------------------------
     # --- PROPOSITION CONSTRUCTION METHODS ---
     # -----------------------------------------------------
     def get_proposition_bitstring(self, k):
         """Return the binary membership vector of proposition k over worlds."""
-        return format(k, f'0{self.n_worlds}b')
+        bits = self._prop_bits.get(k)
+        if bits is None:
+            bits = format(k, f'0{self.n_worlds}b')
+            if self.n_props <= 3:
+                # Memoize only while the proposition space is small enough to enumerate
+                self._prop_bits[k] = bits
+        return bits
+
+    def get_proposition_mask(self, k):
+        """
+        Return proposition P_k as a bitmask over worlds (bit i set <=> W_i in P_k).
+        Out-of-range indices map to the empty mask, like get_proposition_worlds.
+        """
+        return k if 0 <= k < self.n_propositions else 0
 
     def get_proposition_worlds(self, k):
         """Return the set of worlds where proposition P_k holds."""
@@ -246,25 +357,15 @@ class ConceptualFramework:
             # For huge or out-of-range indices, return empty list
             return []
         
-        bitstring = self.get_proposition_bitstring(k)
-        worlds = [f"W{i}" for i, bit in enumerate(bitstring[::-1]) if bit == "1"]
-        return worlds
+        # k is itself the world bitmask of P_k: bit i set <=> W_i in P_k
+        labels = self._world_labels
+        return [labels[i] for i, bit in enumerate(bin(k)[:1:-1]) if bit == "1"]
 
 
 
     def _build_propositions(self):
-        """Construct all propositions as sets of worlds."""
-        props = []
-        for k in range(self.n_propositions):
-            bitstring = self.get_proposition_bitstring(k)
-            worlds = self.get_proposition_worlds(k)
-            props.append({
-                "id": k,
-                "label": f"P{k}",
-                "bitstring": bitstring,
-                "worlds": worlds
-            })
-        return props
+        """Return all propositions as a lazy sequence; entries are built on access."""
+        return _PropositionTable(self)
 
     # -----------------------------------------------------
     # --- EVALUATION UTILITIES ---
@@ -284,14 +385,19 @@ class ConceptualFramework:
         """
         try:
             expr_no_space = expr_str.replace(" ", "")
-            token_pattern = r"¬?B\d+|[∩∪\(\)]"
-            tokens = re.findall(token_pattern, expr_no_space)
+            tokens = _EXPR_TOKEN_RE.findall(expr_no_space)
             if "".join(tokens) != expr_no_space:
                 return "not well-formed: invalid character or token"
 
-            # Check parentheses
+            # Check parentheses; an operand or ")" directly followed by an operand
+            # or "(" would compile to a call, so reject it here as a syntax error
             stack = []
+            prev_closes = False
             for t in tokens:
+                opens = t == "(" or t[-1].isdigit()
+                if prev_closes and opens:
+                    return "not well-formed: syntax error"
+                prev_closes = t == ")" or t[-1].isdigit()
                 if t == "(":
                     stack.append("(")
                 elif t == ")":
@@ -304,16 +410,20 @@ class ConceptualFramework:
             # Translate ∩, ∪ into Python and/or
             expr = expr_str.replace("∩", " and ").replace("∪", " or ")
 
+            # Substitute basic sentences once and compile; only evaluation is per world.
+            # B_i is bit (n_props - 1 - i) of the world id, tested with integer ops.
+            eval_expr = expr
+            for i, prop in enumerate(self.conceptual_framework):
+                shift = self.n_props - 1 - i
+                eval_expr = eval_expr.replace(f"¬{prop}", f"(~w >> {shift} & 1)")
+                eval_expr = eval_expr.replace(f"{prop}", f"(w >> {shift} & 1)")
+            code = compile(eval_expr.lstrip(" \t"), "<expr>", "eval")
+
             result = {"worlds": [], "worldsbit": [], "worldsnotation": []}
             for w in self.possible_worlds:
-                bits = w["bitstring"]
-                eval_expr = expr
-                for i, prop in enumerate(self.conceptual_framework):
-                    eval_expr = eval_expr.replace(f"¬{prop}", f"bits[{i}]=='0'")
-                    eval_expr = eval_expr.replace(f"{prop}", f"bits[{i}]=='1'")
-                if eval(eval_expr):
+                if eval(code, {}, {"w": w["id"]}):
                     result["worlds"].append(w["label"])
-                    result["worldsbit"].append(bits)
+                    result["worldsbit"].append(w["bitstring"])
                     result["worldsnotation"].append(w["notation"])
             return result
 
@@ -352,40 +462,9 @@ class ConceptualFramework:
     # -----------------------------------------------------
     def _prop_view(self, k):
         """Return an object-like view for a proposition, computed on demand."""
-        max_p = 2**(2**self.n_props)-1
         if not (0 <= k < self.n_propositions):
             # Graceful fallback for invalid proposition
-            class InvalidProp:
-                def __init__(self, k, max_p):
-                    self.id = k
-                    self.label = f"P{k} (does not exist)"
-                    self.worlds = []
-                    self.bitstring = ""
-                def __repr__(self):
-                    return f"<{self.label}: does not exist, max index={max_p}>"
             return InvalidProp(k, self.n_propositions - 1)
-
-        class PropView:
-            def __init__(self, space, prop_id):
-                self.space = space
-                self.id = prop_id
-                self.label = f"P{prop_id}"
-
-            @property
-            def worlds(self):
-                return self.space.get_proposition_worlds(self.id)
-
-            @property
-            def bitstring(self):
-                return self.space.get_proposition_bitstring(self.id)
-
-            @property
-            def notation(self):
-                return " ∪ ".join(self.worlds)
-
-            def __repr__(self):
-                return f"<{self.label}: worlds={self.worlds}, bitstring={self.bitstring}>"
-
         return PropView(self, k)
 
     
@@ -1,16 +1,43 @@
-import itertools
+import operator
+from functools import reduce
+from itertools import repeat
 
 # Epistemic Space is general class for various theories in formal epistemology. 
 class EpistemicSpace:
     def __init__(self, conceptual_framework, mass):
         self.concept_framework = conceptual_framework
+        self._worlds_cache = {}            # proposition P-decimal → frozenset of its worlds
         self.mass_thresholds = {}          # proposition P-decimal → mass threshold
         self.global_mass_threshold = 0 # mass threshold for all except in mass threshold
         self.credence_thresholds = {} # proposition P-decimal → credence threshold
         self.credence_global_threshold = 0 ## credence threshold for all except in credence threshold
         self.mass = mass                   # proposition P-decimal → mass more than 0 to 1 / (0,1)
-        self.acceptance_base = self.credence_endorsed_focal_subsets(2**self.concept_framework.n_props - 1)
-        self.inferable_bases = self.get_inferable_base()
+        self._cache_masses = {}            # copy of self.mass taken when the cache was filled
+        self._cache = {}                   # (query, prop_id, ...) → result, dropped once self.mass differs from _cache_masses
+
+    @property
+    def acceptance_base(self):
+        """
+        Credence of the acceptance base, computed on access from the
+        (cached) endorsed focal subsets for the current masses and thresholds.
+        """
+        return self.credence_endorsed_focal_subsets(2**self.concept_framework.n_props - 1)
+
+    @property
+    def inferable_bases(self):
+        """
+        Inferable bases (see get_inferable_base), computed on first access and
+        recomputed only after masses or mass thresholds change.
+        """
+        # Only the result for the latest threshold snapshot is kept
+        cache = self._query_cache()
+        thresholds = self._threshold_key()
+        entry = cache.get("inferable_bases")
+        if entry is None or entry[0] != thresholds:
+            entry = cache["inferable_bases"] = (thresholds, tuple(
+                (frozenset(base), frozenset(worlds)) for base, worlds in self.get_inferable_base()))
+        # Fresh sets on every access, so callers cannot alter the cached result
+        return [(set(base), set(worlds)) for base, worlds in entry[1]]
 
     def set_mass(self, prop_id, value):
         """
@@ -41,47 +68,94 @@ class EpistemicSpace:
         """
         return self.credence_thresholds.get(prop_id, self.credence_global_threshold)
 
+    def _mask(self, prop_id):
+        """
+        Return the worlds of P_prop_id as a bitmask (bit i set <=> W_i in P_prop_id).
+        Subset tests become (a & b) == a and intersections become a & b.
+        """
+        return self.concept_framework.get_proposition_mask(prop_id)
+
+    def _worlds(self, prop_id):
+        """
+        Return the worlds of P_prop_id as a frozenset, memoized per proposition
+        (the conceptual framework never changes, so entries never go stale).
+        """
+        worlds = self._worlds_cache.get(prop_id)
+        if worlds is None:
+            worlds = frozenset(self.concept_framework.get_proposition_worlds(prop_id))
+            self._worlds_cache[prop_id] = worlds
+        return worlds
+
+    def _query_cache(self):
+        """
+        Return the memo table for mass-dependent queries, emptied first if
+        masses have changed since it was filled. self.mass may be the caller's
+        own dict and edited directly, so it is compared to the copy taken
+        when the cache was filled.
+        """
+        if self.mass != self._cache_masses:
+            self._cache = {}
+            self._cache_masses = dict(self.mass)
+        return self._cache
+
+    def _mass_masks(self):
+        """
+        Return (prop_id, world bitmask) pairs for all propositions with mass,
+        built once per set of masses and shared by the focal-subset queries.
+        """
+        cache = self._query_cache()
+        if "mass_masks" not in cache:
+            cache["mass_masks"] = tuple((pid, self._mask(pid)) for pid in self.mass)
+        return cache["mass_masks"]
+
+    def _threshold_key(self):
+        """Hashable snapshot of the mass thresholds, which are set as plain attributes."""
+        return (self.global_mass_threshold, tuple(self.mass_thresholds.items()))
+
     def focal_subsets(self, prop_id):
         """
         Return all propositions (keys in self.mass) that are subsets of the 
         given proposition P_prop_id. Only considers propositions that have mass assigned.
         """
-        target_worlds = set(self.concept_framework.get_proposition_worlds(prop_id))
-        
-        focal_subsets = []
-        for pid in self.mass:
-            prop_worlds = set(self.concept_framework.get_proposition_worlds(pid))
-            if prop_worlds and prop_worlds.issubset(target_worlds):
-                focal_subsets.append(pid)
-        
-        return focal_subsets
+        cache = self._query_cache()
+        key = ("focal", prop_id)
+        if key not in cache:
+            target_mask = self._mask(prop_id)
+            cache[key] = tuple(pid for pid, prop_mask in self._mass_masks()
+                               if prop_mask and (prop_mask & target_mask) == prop_mask)
+
+        return list(cache[key])
 
     def endorsed_focal_subsets(self, prop_id):
         """
         Return all focal subsets of P_prop_id that meet their mass threshold,
         or the global mass threshold if no specific threshold is set.
         """
-        target_worlds = set(self.concept_framework.get_proposition_worlds(prop_id))
-        
-        endorsed_subsets = []
-        for pid in self.mass:
-            prop_worlds = set(self.concept_framework.get_proposition_worlds(pid))
-            if not prop_worlds.issubset(target_worlds):
-                continue  # only subsets
-            if self.mass.get(pid, 0) >= self.get_mass_threshold(pid):
-                endorsed_subsets.append(pid)
-        
-        return endorsed_subsets
+        # Thresholds are plain attributes, so the cached entry records the
+        # snapshot it was computed for and is replaced when they change
+        cache = self._query_cache()
+        key = ("endorsed", prop_id)
+        thresholds = self._threshold_key()
+        entry = cache.get(key)
+        if entry is None or entry[0] != thresholds:
+            target_mask = self._mask(prop_id)
+            mass = self.mass
+            mass_thresholds = self.mass_thresholds
+            global_threshold = self.global_mass_threshold
+            entry = cache[key] = (thresholds, tuple(
+                pid for pid, prop_mask in self._mass_masks()
+                if (prop_mask & target_mask) == prop_mask  # only subsets
+                and mass.get(pid, 0) >= mass_thresholds.get(pid, global_threshold)))
+
+        return list(entry[1])
     
     def credence_focal_subsets(self, prop_id):
         """
         Calculate the credence of a proposition as the sum of masses
         of all its focal subsets.
         """
-        total_credence = 0
-        for pid in self.focal_subsets(prop_id):
-            total_credence += self.get_mass(pid)
-        return total_credence
+        # mass.get(pid, 0) for every pid, summed in a single C-level pass
+        return sum(map(self.mass.get, self.focal_subsets(prop_id), repeat(0)))
 
 
     def credence_endorsed_focal_subsets(self, prop_id):
@@ -89,10 +163,8 @@ class EpistemicSpace:
         Calculate the credence of a proposition as the sum of masses
         of all its endorsed focal subsets (meeting mass thresholds).
         """
-        total_credence = 0
-        for pid in self.endorsed_focal_subsets(prop_id):
-            total_credence += self.get_mass(pid)
-        return total_credence
+        # mass.get(pid, 0) for every pid, summed in a single C-level pass
+        return sum(map(self.mass.get, self.endorsed_focal_subsets(prop_id), repeat(0)))
     
     def show_possibleworld_masses(self, as_table=False):
         """
@@ -125,44 +197,54 @@ class EpistemicSpace:
         Return all minimal ground sets of focal propositions for prop_id.
         Each ground set is a set of focal subsets whose intersection is
         contained in prop_id, and minimal in the sense that removing any
-        member breaks this property.
+        member breaks this property. Ground sets are returned as frozensets.
         """
         # Step 1: focal subsets (only those with mass)
         focal = self.focal_subsets(prop_id)
-        ground_sets_list = []
-
-        # Step 2: generate all non-empty combinations
-        for r in range(1, len(focal)+1):
-            for combo in itertools.combinations(focal, r):
-                # Compute intersection of worlds
-                combo_worlds = [set(self.concept_framework.get_proposition_worlds(pid)) for pid in combo]
-                intersection = set.intersection(*combo_worlds)
-                target_worlds = set(self.concept_framework.get_proposition_worlds(prop_id))
-                if intersection.issubset(target_worlds):
-                    # Step 3: check minimality
-                    minimal = True
-                    for i in range(len(combo)):
-                        reduced_combo = combo[:i] + combo[i+1:]
-                        if reduced_combo:
-                            reduced_intersection = set.intersection(*[set(self.concept_framework.get_proposition_worlds(pid)) for pid in reduced_combo])
-                            if reduced_intersection.issubset(target_worlds):
-                                minimal = False
-                                break
-                    if minimal:
-                        ground_sets_list.append(set(combo))
-        return ground_sets_list
+        target_mask = self._mask(prop_id)
+        masks = [self._mask(pid) for pid in focal]
+
+        def contained(inter):
+            return (inter & target_mask) == inter
+
+        found = []  # index tuples into focal
+
+        # Step 2: depth-first search over index-increasing combinations.
+        # Intersections only shrink as members are added, so once a combination
+        # is contained in prop_id no extension of it can be minimal: record it
+        # (if minimal) and backtrack instead of enumerating its supersets.
+        # An explicit stack of (next index, combination, intersection) replaces
+        # recursion; -1 has every bit set: the universe of worlds.
+        n = len(focal)
+        stack = [(0, (), -1)]
+        while stack:
+            start, combo, inter = stack.pop()
+            for j in range(start, n):
+                new_combo = combo + (j,)
+                new_inter = inter & masks[j]
+                if contained(new_inter):
+                    # Step 3: minimal iff dropping any member breaks containment
+                    # (dropping the last one is known to, from the search path)
+                    if not any(contained(reduce(operator.and_, (masks[i] for i in new_combo if i != k)))
+                               for k in new_combo[:-1]):
+                        found.append(new_combo)
+                else:
+                    stack.append((j + 1, new_combo, new_inter))
+
+        # Report in the same order as enumerating combinations by size
+        found.sort(key=lambda combo: (len(combo), combo))
+        return [frozenset(focal[i] for i in combo) for combo in found]
     
     def min_mass_of_set(self, prop_ids):
         """
         For a set/list of propositions, return the minimum mass among them.
         Returns 'not assessable' if any proposition does not have mass assigned.
         """
-        masses = []
-        for pid in prop_ids:
-            if pid not in self.mass:
-                return "not assessable"
-            masses.append(self.mass[pid])
-        return min(masses) if masses else "not all propostions have mass"
+        mass = self.mass
+        prop_ids = tuple(prop_ids)  # read twice below, so accept one-shot iterables too
+        if not all(map(mass.__contains__, prop_ids)):
+            return "not assessable"
+        return min(map(mass.__getitem__, prop_ids), default="not all propostions have mass")
     
     def ground_sets_with_min_mass(self, prop_id):
         """
@@ -194,54 +276,36 @@ class EpistemicSpace:
         focal = (self.endorsed_focal_subsets(full_prop_id)
                 if endorsed else self.focal_subsets(full_prop_id))
 
-        # Map each proposition to its world set
-        prop_worlds = {pid: set(self.concept_framework.get_proposition_worlds(pid)) for pid in focal}
-
-        # Helper function: intersection of worlds for a subset
-        def intersection_of(subset):
-            if not subset:
-                return set()
-            inter = set(prop_worlds[next(iter(subset))])
-            for pid in subset:
-                inter &= prop_worlds[pid]
-                if not inter:
-                    break
-            return inter
-
-        results = []
-
-        # Recursive backtracking to explore all consistent combinations
-        def backtrack(remaining, current):
-            inter = intersection_of(current)
-            if not inter:
-                return  # inconsistent; backtrack
+        # Subsets are bitmasks over positions in sorted_focal; worlds are bitmasks too
+        sorted_focal = sorted(focal)
+        masks = [self._mask(pid) for pid in sorted_focal]
+        n = len(sorted_focal)
+
+        # Iterative depth-first search over index-increasing consistent subsets.
+        # Each subset is reached along exactly one increasing chain, so nothing
+        # is visited twice. A subset is kept once no later proposition can extend
+        # it; per intersection only the largest such subset is retained.
+        largest_by_intersection = {}  # intersection mask → subset mask
+        stack = [(1 << i, i, masks[i]) for i in reversed(range(n)) if masks[i]]
+        while stack:
+            subset, last, inter = stack.pop()
 
             # Try to extend
             extended = False
-            for pid in list(remaining):
-                if intersection_of(current | {pid}):
+            for j in range(n - 1, last, -1):
+                new_inter = inter & masks[j]
+                if new_inter:
                     extended = True
-                    backtrack({p for p in remaining if p > pid}, current | {pid})
+                    stack.append((subset | (1 << j), j, new_inter))
 
             # If not extendable further → it's maximal
             if not extended:
-                if current not in results:
-                    results.append(current)
-
-        # Start from each focal proposition
-        sorted_focal = sorted(focal)
-        for i, pid in enumerate(sorted_focal):
-            backtrack(set(sorted_focal[i + 1:]), {pid})
+                best = largest_by_intersection.get(inter)
+                if best is None or subset.bit_count() > best.bit_count():
+                    largest_by_intersection[inter] = subset
 
-        # Deduplicate by intersection: keep largest subset for each intersection
-        unique_by_intersection = {}
-        for s in results:
-            inter = intersection_of(s)
-            key = frozenset(inter)  # make it hashable
-            if key not in unique_by_intersection or len(s) > len(unique_by_intersection[key]):
-                unique_by_intersection[key] = s
-
-        return [(s, intersection_of(s)) for s in unique_by_intersection.values()]
+        return [({pid for i, pid in enumerate(sorted_focal) if subset >> i & 1}, set(self._worlds(inter)))
+                for inter, subset in largest_by_intersection.items()]
 
 
 
@@ -257,24 +321,13 @@ class EpistemicSpace:
         Returns:
             List of tuples: (inferable_base, ground, min_mass)
         """
-        target_worlds = set(self.concept_framework.get_proposition_worlds(target_prop_id))
+        target_mask = self._mask(target_prop_id)
         results = []
 
         # Iterate over each inferable base
         for base, base_intersection in self.inferable_bases:
             base_props = list(base)
-            prop_worlds = {pid: set(self.concept_framework.get_proposition_worlds(pid)) for pid in base_props}
-
-            def intersection_of(subset):
-                """Compute intersection of worlds for a subset of proposition IDs."""
-                if not subset:
-                    return set()
-                inter = set(prop_worlds[next(iter(subset))])
-                for pid in subset:
-                    inter &= prop_worlds[pid]
-                    if not inter:
-                        break
-                return inter
+            prop_masks = {pid: self._mask(pid) for pid in base_props}
 
             def min_mass(subset):
                 """Get the minimum mass among propositions in subset."""
@@ -283,15 +336,11 @@ class EpistemicSpace:
 
             grounds_for_base = []
 
-            # Recursive search for minimal subsets
-            def search(current_set, remaining_props):
-                if current_set:
-                    inter = intersection_of(current_set)
-                else:
-                    inter = target_worlds.copy()
-
+            # Recursive search for minimal non-empty subsets;
+            # inter is the intersection of current_set, carried down
+            def search(current_set, remaining_props, inter):
                 # Skip empty or irrelevant intersections
-                if not inter or not inter.issubset(target_worlds):
+                if not inter or (inter & target_mask) != inter:
                     return
 
                 # Check minimality
@@ -299,13 +348,14 @@ class EpistemicSpace:
                     if g.issubset(current_set):
                         return
 
-                if current_set:
-                    grounds_for_base.append(set(current_set))
+                grounds_for_base.append(set(current_set))
 
                 for i, pid in enumerate(remaining_props):
-                    search(current_set | {pid}, remaining_props[i+1:])
+                    search(current_set | {pid}, remaining_props[i+1:], inter & prop_masks[pid])
 
-            search(set(), base_props)
+            if target_mask:
+                for i, pid in enumerate(base_props):
+                    search({pid}, base_props[i+1:], prop_masks[pid])
 
             # Add results with min mass
             for g in grounds_for_base:
@@ -322,27 +372,24 @@ class EpistemicSpace:
         - strongest grounds within each inferable base
         - globally strongest grounds across all bases
         """
-        all_grounds = self.get_grounds(target_prop_id)
-        if not all_grounds:
+        # --- Single pass: keep only the strongest grounds seen so far per base ---
+        strongest = {}  # frozenset(base) → (max strength, [(base, ground, strength), ...])
+        global_max = None
+        for base, ground, strength in self.get_grounds(target_prop_id):
+            key = frozenset(base)
+            best = strongest.get(key)
+            if best is None or strength > best[0]:
+                strongest[key] = (strength, [(set(base), ground, strength)])
+            elif strength == best[0]:
+                best[1].append((set(base), ground, strength))
+            if global_max is None or strength > global_max:
+                global_max = strength
+
+        if global_max is None:
             return {"by_base": [], "global": []}
 
-        # --- Group by inferable base ---
-        from collections import defaultdict
-        base_groups = defaultdict(list)
-        for base, ground, strength in all_grounds:
-            base_groups[frozenset(base)].append((ground, strength))
-
-        # --- Find strongest per base ---
-        by_base = []
-        for base, grounds in base_groups.items():
-            max_strength = max(strength for _, strength in grounds)
-            strongest_in_base = [
-                (set(base), g, s) for g, s in grounds if s == max_strength
-            ]
-            by_base.extend(strongest_in_base)
-
-        # --- Find globally strongest ---
-        global_max = max(s for _, _, s in by_base)
+        # --- Strongest per base, then globally strongest among them ---
+        by_base = [item for _, items in strongest.values() for item in items]
         global_strongest = [
             (base, g, s) for base, g, s in by_base if s == global_max
         ]
@@ -1,24 +1,35 @@
+import asyncio
+
 from ib_insync import *
 
-# Connect to TWS or IB Gateway
-ib = IB()
-ib.connect('127.0.0.1', 7497, clientId=1)
 
-# Define a contract (Apple stock)
-contract = Stock('AAPL', 'SMART', 'USD')
+async def main():
+    # Connect to TWS or IB Gateway
+    ib = IB()
+    await ib.connectAsync('127.0.0.1', 7497, clientId=1)
+
+    # Define contracts (Apple stock); further symbols are requested concurrently
+    contracts = [Stock('AAPL', 'SMART', 'USD')]
+
+    # Request historical daily bars (last 1 year) for all contracts in parallel
+    bars = await asyncio.gather(*[
+        ib.reqHistoricalDataAsync(
+            contract,
+            endDateTime='',
+            durationStr='1 Y',
+            barSizeSetting='1 day',
+            whatToShow='MIDPOINT',
+            useRTH=True
+        )
+        for contract in contracts
+    ])
+
+    # Convert to DataFrame
+    for data in bars:
+        df = util.df(data)
+        print(df.head())
 
-# Request historical daily bars (last 1 year)
-data = ib.reqHistoricalData(
-    contract,
-    endDateTime='',
-    durationStr='1 Y',
-    barSizeSetting='1 day',
-    whatToShow='MIDPOINT',
-    useRTH=True
-)
+    ib.disconnect()
 
-# Convert to DataFrame
-df = util.df(data)
-print(df.head())
 
-ib.disconnect()
+asyncio.run(main())
@@ -4,6 +4,9 @@ from fastapi.responses import HTMLResponse, JSONResponse
 from fastapi.staticfiles import StaticFiles
 from fastapi.templating import Jinja2Templates
 from belief_revision import BeliefRevision
+from cachetools import LRUCache
+from collections import defaultdict
+import asyncio
 import json
 from typing import List
 
@@ -16,7 +19,20 @@ app.mount("/static", StaticFiles(directory="static"), name="static")
 # ----------------------
 # In-memory storage for agents
 # ----------------------
-agents = {}  # key: agent name, value: BeliefRevision instance
+MAX_AGENTS = 1024
+
+class AgentCache(LRUCache):
+    """LRU store of agents that also forgets the lock and sync flag of evicted agents."""
+
+    def popitem(self):
+        name, agent = super().popitem()
+        agent_locks.pop(name, None)
+        stale_agents.discard(name)
+        return name, agent
+
+agents = AgentCache(maxsize=MAX_AGENTS)  # key: agent name, value: BeliefRevision instance
+agent_locks = defaultdict(asyncio.Lock)  # one lock per agent name
+stale_agents = set()  # agents changed since their epistemic space was last synced
 
 # ----------------------
 # Routes
@@ -34,7 +50,9 @@ async def create_agent(
 ):
     try:
         agent = BeliefRevision(name=name, propositions=propositions)
-        agents[name] = agent
+        async with agent_locks[name]:
+            agents[name] = agent
+            stale_agents.discard(name)
         return {"status": "success", "message": f"Agent '{name}' created."}
     except Exception as e:
         return {"status": "error", "message": str(e)}
@@ -50,42 +68,59 @@ async def add_proposition(
 ):
     if name not in agents:
         return JSONResponse({"status": "error", "message": "Agent not found."})
-    agent = agents[name]
-    agent.add_proposition(proposition, is_core=is_core, rank=rank)
-    agent.sync_epistemic_space()  # keep consistent
-    return JSONResponse({"status": "success", "K": agent.K, "core": list(agent.core), "entrenchment": agent.entrenchment})
+    async with agent_locks[name]:
+        agent = agents.get(name)
+        if agent is None:  # evicted while waiting for the lock
+            return JSONResponse({"status": "error", "message": "Agent not found."})
+        agent.add_proposition(proposition, is_core=is_core, rank=rank)
+        stale_agents.add(name)  # synced lazily on the next state read
+        return JSONResponse({"status": "success", "K": agent.K, "core": list(agent.core), "entrenchment": agent.entrenchment})
 
 # Contract a belief
 @app.post("/agent/contract")
 async def contract_belief(name: str = Form(...), belief: str = Form(...)):
     if name not in agents:
         return JSONResponse({"status": "error", "message": "Agent not found."})
-    agent = agents[name]
-    removed = list(agent.contract(belief))
-    agent.sync_epistemic_space()  # keep consistent
-    return JSONResponse({"status": "success", "removed": removed, "K": agent.K})
+    async with agent_locks[name]:
+        agent = agents.get(name)
+        if agent is None:  # evicted while waiting for the lock
+            return JSONResponse({"status": "error", "message": "Agent not found."})
+        removed = list(agent.contract(belief))
+        stale_agents.add(name)  # synced lazily on the next state read
+        return JSONResponse({"status": "success", "removed": removed, "K": agent.K})
 
 # Expand a belief
 @app.post("/agent/expand")
 async def expand_belief(name: str = Form(...), belief: str = Form(...)):
     if name not in agents:
         return JSONResponse({"status": "error", "message": "Agent not found."})
-    agent = agents[name]
-    agent.expand(belief)
-    agent.sync_epistemic_space()  # keep consistent
-    return JSONResponse({"status": "success", "K": agent.K})
+    async with agent_locks[name]:
+        agent = agents.get(name)
+        if agent is None:  # evicted while waiting for the lock
+            return JSONResponse({"status": "error", "message": "Agent not found."})
+        agent.expand(belief)
+        stale_agents.add(name)  # synced lazily on the next state read
+        return JSONResponse({"status": "success", "K": agent.K})
 # Get agent state
 @app.get("/agent/state")
 async def get_agent_state(name: str):
     if name not in agents:
         return JSONResponse({"status": "error", "message": "Agent not found."})
-    agent = agents[name]
-    return JSONResponse({
-        "status": "success",
-        "state": {
-            "K": agent.K,
-            "core": list(agent.core),
-            "entrenchment": agent.entrenchment
-        }
-    })
+    async with agent_locks[name]:
+        agent = agents.get(name)
+        if agent is None:  # evicted while waiting for the lock
+            return JSONResponse({"status": "error", "message": "Agent not found."})
+        if name in stale_agents:
+            # Coalesce all writes since the last read into a single sync, run off
+            # the event loop; writes to this agent wait on its lock meanwhile
+            await asyncio.to_thread(agent.sync_epistemic_space)
+            stale_agents.discard(name)
+        return JSONResponse({
+            "status": "success",
+            "state": {
+                "K": agent.K,
+                "core": list(agent.core),
+                "entrenchment": agent.entrenchment
+            }
+        })
 